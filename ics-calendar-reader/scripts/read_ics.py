@@ -6,24 +6,54 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import hashlib
+import heapq
 import json
 import os
 import re
 import sys
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from urllib.parse import urlsplit, urlunsplit
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     from zoneinfo import ZoneInfo
 except Exception:  # pragma: no cover
     ZoneInfo = None
 
-
-DATE_RE = re.compile(r"^\d{8}$")
-DATETIME_RE = re.compile(r"^\d{8}T\d{6}Z?$")
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# name, optional ";PARAM=..." run, then the value after the first colon.
+PROPERTY_RE = re.compile(r"([^;:]+)((?:;[^:]*)?):(.*)", re.DOTALL)
+ICAL_ESCAPE_RE = re.compile(r"\\[\\nN,;]")
+ICAL_ESCAPES = {
+    "\\\\": "\\",
+    "\\n": "\n",
+    "\\N": "\n",
+    "\\,": ",",
+    "\\;": ";",
+}
+# Properties copied verbatim (after unescaping) onto the event.
+TEXT_PROPERTY_FIELDS = {
+    "SUMMARY": "summary",
+    "DESCRIPTION": "description",
+    "LOCATION": "location",
+    "STATUS": "status",
+    "UID": "uid",
+    "ORGANIZER": "organizer",
+}
+# Every property iter_ics_events reads; other lines are skipped unparsed.
+EVENT_PROPERTIES = frozenset(TEXT_PROPERTY_FIELDS) | {"ATTENDEE", "DTSTART", "DTEND"}
 WEEKDAY_ABBR = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 MONTH_ABBR = [
     "Jan",
@@ -40,6 +70,58 @@ MONTH_ABBR = [
     "Dec",
 ]
 DEFAULT_CACHE_TTL_SECONDS = 900
+MAX_FETCH_WORKERS = 8
+# Resolved once per run; display formatting reuses it for every event.
+LOCAL_TZ = dt.datetime.now().astimezone().tzinfo
+# fromisoformat accepts the compact YYYYMMDD[THHMMSS[Z]] form from Python 3.11.
+FROMISOFORMAT_BASIC = sys.version_info >= (3, 11)
+# dataclass(slots=True) needs Python 3.10; older interpreters get a plain dataclass.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class Event:
+    summary: Optional[str] = None
+    start: Optional[str] = None
+    end: Optional[str] = None
+    all_day: bool = False
+    location: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    uid: Optional[str] = None
+    organizer: Optional[str] = None
+    attendees: List[str] = field(default_factory=list)
+    # Set by filter_events and add_display_datetimes.
+    is_ongoing: Optional[bool] = None
+    start_local: Optional[str] = None
+    end_local: Optional[str] = None
+    # Comparable datetimes computed while parsing; not part of the output.
+    sort_start: Optional[dt.datetime] = None
+    sort_end: Optional[dt.datetime] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "summary": self.summary,
+            "start": self.start,
+            "end": self.end,
+            "all_day": self.all_day,
+            "location": self.location,
+            "description": self.description,
+            "status": self.status,
+            "uid": self.uid,
+            "organizer": self.organizer,
+            "attendees": self.attendees,
+            "is_ongoing": self.is_ongoing,
+            "start_local": self.start_local,
+            "end_local": self.end_local,
+        }
+
+
+def dump_json(value: object) -> str:
+    """Serialize with orjson when installed; output matches json.dumps(indent=2)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(value, indent=2, ensure_ascii=False)
 
 
 def parse_env_line(line: str) -> Optional[Tuple[str, str]]:
@@ -97,41 +179,100 @@ def load_env_defaults(skill_root: Path) -> None:
         os.environ.setdefault(key, value)
 
 
-def unfold_ical_lines(text: str) -> List[str]:
-    """Join folded ICS lines (continuations start with space or tab)."""
-    raw_lines = text.splitlines()
-    unfolded: List[str] = []
-    for line in raw_lines:
-        if not unfolded:
-            unfolded.append(line)
+def iter_unfolded_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield folded ICS lines joined (continuations start with space or tab).
+
+    Trailing line breaks are stripped, so an open file can be passed directly.
+    """
+    # Collect a logical line's pieces and join once, so long folded
+    # DESCRIPTIONs are not rebuilt on every continuation.
+    parts: List[str] = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if parts and line.startswith((" ", "\t")):
+            parts.append(line[1:])
             continue
-        if line.startswith(" ") or line.startswith("\t"):
-            unfolded[-1] += line[1:]
-        else:
-            unfolded.append(line)
-    return unfolded
+        if parts:
+            yield parts[0] if len(parts) == 1 else "".join(parts)
+        parts = [line]
+    if parts:
+        yield parts[0] if len(parts) == 1 else "".join(parts)
 
 
 def unescape_ical_text(value: str) -> str:
-    return (
-        value.replace("\\\\", "\\")
-        .replace("\\n", "\n")
-        .replace("\\N", "\n")
-        .replace("\\,", ",")
-        .replace("\\;", ";")
-    )
+    if "\\" not in value:
+        return value
+    return ICAL_ESCAPE_RE.sub(replace_ical_escape, value)
+
+
+def replace_ical_escape(match: re.Match) -> str:
+    return ICAL_ESCAPES[match.group()]
 
 
 def parse_property(line: str) -> Tuple[str, Dict[str, str], str]:
-    left, _, value = line.partition(":")
-    key_part, *param_parts = left.split(";")
-    key = key_part.upper()
+    match = PROPERTY_RE.match(line)
+    if match is None:
+        # Malformed line with an empty property name.
+        return "", {}, line.partition(":")[2]
+
+    key_part, param_run, value = match.groups()
     params: Dict[str, str] = {}
-    for part in param_parts:
-        if "=" in part:
-            pkey, pvalue = part.split("=", 1)
-            params[pkey.upper()] = pvalue
-    return key, params, value
+    if param_run:
+        upper = str.upper
+        for part in param_run[1:].split(";"):
+            if "=" in part:
+                pkey, pvalue = part.split("=", 1)
+                params[upper(pkey)] = pvalue
+    return key_part.upper(), params, value
+
+
+def is_ical_date(value: str) -> bool:
+    """Match YYYYMMDD without the per-call overhead of a regex."""
+    return len(value) == 8 and value.isdecimal()
+
+
+def is_ical_datetime(value: str) -> bool:
+    """Match YYYYMMDDTHHMMSS with an optional trailing Z."""
+    length = len(value)
+    return (
+        (length == 15 or (length == 16 and value[15] == "Z"))
+        and value[8] == "T"
+        and value[:8].isdecimal()
+        and value[9:15].isdecimal()
+    )
+
+
+def parse_basic_datetime(value: str) -> dt.datetime:
+    """Parse text already accepted by is_ical_date or is_ical_datetime."""
+    if FROMISOFORMAT_BASIC:
+        try:
+            return dt.datetime.fromisoformat(value)
+        except ValueError:
+            pass  # Non-ASCII digits; the slicing path below still handles them.
+
+    # The shape checks pin the layout, so slice fixed offsets instead of strptime.
+    if len(value) == 8:
+        return dt.datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+    return dt.datetime(
+        int(value[0:4]),
+        int(value[4:6]),
+        int(value[6:8]),
+        int(value[9:11]),
+        int(value[11:13]),
+        int(value[13:15]),
+        tzinfo=dt.timezone.utc if value.endswith("Z") else None,
+    )
+
+
+@lru_cache(maxsize=64)
+def lookup_zone(tzid: str) -> Optional[dt.tzinfo]:
+    """Resolve a TZID once per process; unknown zones resolve to None."""
+    if ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(tzid)
+    except Exception:
+        return None
 
 
 def parse_dt(value: str, params: Dict[str, str]) -> Tuple[Optional[dt.datetime], Optional[str], bool]:
@@ -139,145 +280,154 @@ def parse_dt(value: str, params: Dict[str, str]) -> Tuple[Optional[dt.datetime],
     value = value.strip()
     tzid = params.get("TZID")
 
-    if DATE_RE.match(value):
-        d = dt.datetime.strptime(value, "%Y%m%d").date()
+    if is_ical_date(value):
+        as_dt = parse_basic_datetime(value)
         # Represent all-day at midnight local (naive), plus explicit all_day flag.
-        as_dt = dt.datetime.combine(d, dt.time.min)
-        return as_dt, d.isoformat(), True
-
-    if DATETIME_RE.match(value):
-        if value.endswith("Z"):
-            parsed = dt.datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(
-                tzinfo=dt.timezone.utc
-            )
-            return parsed, parsed.isoformat(), False
-
-        parsed = dt.datetime.strptime(value, "%Y%m%dT%H%M%S")
-        if tzid and ZoneInfo is not None:
-            try:
-                parsed = parsed.replace(tzinfo=ZoneInfo(tzid))
-            except Exception:
-                pass
+        return as_dt, as_dt.date().isoformat(), True
+
+    if is_ical_datetime(value):
+        parsed = parse_basic_datetime(value)
+        if tzid and parsed.tzinfo is None:
+            zone = lookup_zone(tzid)
+            if zone is not None:
+                parsed = parsed.replace(tzinfo=zone)
         return parsed, parsed.isoformat(), False
 
     return None, None, False
 
 
-def parse_ics_events(text: str) -> List[Dict[str, object]]:
-    lines = unfold_ical_lines(text)
+def assume_utc(value: Optional[dt.datetime]) -> Optional[dt.datetime]:
+    """Treat naive datetimes as UTC, matching normalize_event_start/end."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value
 
-    events: List[Dict[str, object]] = []
-    current: Optional[Dict[str, object]] = None
 
-    for line in lines:
+def parse_ics_events(text: str) -> List[Event]:
+    return list(iter_ics_events(text.splitlines()))
+
+
+def iter_ics_file_events(path: str) -> Iterator[Event]:
+    # Stream the file so large exports are never held in memory whole.
+    # newline="" skips newline translation; line breaks are stripped later.
+    with open(path, encoding="utf-8", errors="replace", newline="") as handle:
+        yield from iter_ics_events(handle)
+
+
+def iter_ics_events(lines: Iterable[str]) -> Iterator[Event]:
+    """Yield each VEVENT as soon as its END:VEVENT line is read."""
+    current: Optional[Event] = None
+    # Recurring exports repeat the same DTSTART/DTEND values many times.
+    dt_cache: Dict[Tuple[str, Optional[str]], Tuple[Optional[dt.datetime], Optional[str], bool]] = {}
+
+    for line in iter_unfolded_lines(lines):
         if line == "BEGIN:VEVENT":
-            current = {
-                "summary": None,
-                "start": None,
-                "end": None,
-                "all_day": False,
-                "location": None,
-                "description": None,
-                "status": None,
-                "uid": None,
-                "organizer": None,
-                "attendees": [],
-                "_sort_start": None,
-            }
+            current = Event()
             continue
 
         if line == "END:VEVENT":
             if current is not None:
-                events.append(current)
+                yield current
             current = None
             continue
 
-        if current is None or ":" not in line:
+        if current is None:
+            continue
+        colon = line.find(":")
+        if colon == -1:
+            continue
+        # Skip RRULE, X-*, VALARM lines etc. before tokenizing parameters.
+        semicolon = line.find(";", 0, colon)
+        key = line[: semicolon if semicolon != -1 else colon].upper()
+        if key not in EVENT_PROPERTIES:
             continue
 
-        key, params, value = parse_property(line)
+        if semicolon == -1:
+            # No parameters (the common case): skip the regex tokenizer.
+            params: Dict[str, str] = {}
+            value = line[colon + 1 :]
+        else:
+            key, params, value = parse_property(line)
         raw_value = unescape_ical_text(value)
 
-        if key == "SUMMARY":
-            current["summary"] = raw_value
-        elif key == "DESCRIPTION":
-            current["description"] = raw_value
-        elif key == "LOCATION":
-            current["location"] = raw_value
-        elif key == "STATUS":
-            current["status"] = raw_value
-        elif key == "UID":
-            current["uid"] = raw_value
-        elif key == "ORGANIZER":
-            current["organizer"] = raw_value
+        attr = TEXT_PROPERTY_FIELDS.get(key)
+        if attr is not None:
+            setattr(current, attr, raw_value)
         elif key == "ATTENDEE":
             cn = params.get("CN")
             attendee_value = raw_value
             if cn:
                 attendee_value = f"{cn} <{raw_value}>"
-            current["attendees"].append(attendee_value)
-        elif key == "DTSTART":
-            sort_dt, iso, all_day = parse_dt(raw_value, params)
-            current["start"] = iso
-            current["all_day"] = all_day
-            current["_sort_start"] = sort_dt
-        elif key == "DTEND":
-            _, iso, _ = parse_dt(raw_value, params)
-            current["end"] = iso
-
-    for event in events:
-        event.pop("_sort_start", None)
-
-    return events
+            current.attendees.append(attendee_value)
+        elif key == "DTSTART" or key == "DTEND":
+            cache_key = (raw_value, params.get("TZID"))
+            parsed = dt_cache.get(cache_key)
+            if parsed is None:
+                sort_dt, iso, all_day = parse_dt(raw_value, params)
+                parsed = dt_cache[cache_key] = (assume_utc(sort_dt), iso, all_day)
+            sort_dt, iso, all_day = parsed
+            if key == "DTSTART":
+                current.start = iso
+                current.all_day = all_day
+                current.sort_start = sort_dt
+            else:
+                current.end = iso
+                current.sort_end = sort_dt
+
+
+def parse_iso_utc(value: str) -> dt.datetime:
+    """Parse an ISO date or datetime; naive values are taken as UTC."""
+    if value.endswith("Z"):
+        # fromisoformat only accepts a trailing Z from Python 3.11.
+        value = value[:-1] + "+00:00"
+    parsed = dt.datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=dt.timezone.utc)
+    return parsed
 
 
 def parse_filter_dt(value: str) -> dt.datetime:
     if value.lower() == "now":
         return dt.datetime.now(dt.timezone.utc)
-    parsed = dt.datetime.fromisoformat(value)
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=dt.timezone.utc)
-    return parsed
+    return parse_iso_utc(value)
 
 
-def normalize_event_start(event: Dict[str, object]) -> Optional[dt.datetime]:
-    start = event.get("start")
+def normalize_event_start(event: Event) -> Optional[dt.datetime]:
+    start = event.start
     if not isinstance(start, str):
         return None
     try:
-        if len(start) == 10:
-            d = dt.date.fromisoformat(start)
-            return dt.datetime.combine(d, dt.time.min).replace(tzinfo=dt.timezone.utc)
-        parsed = dt.datetime.fromisoformat(start)
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt.timezone.utc)
-        return parsed
+        return parse_iso_utc(start)
     except Exception:
         return None
 
 
-def normalize_event_end(event: Dict[str, object]) -> Optional[dt.datetime]:
-    end = event.get("end")
+def normalize_event_end(event: Event) -> Optional[dt.datetime]:
+    end = event.end
     if not isinstance(end, str):
         return normalize_event_start(event)
     try:
-        if len(end) == 10:
-            d = dt.date.fromisoformat(end)
-            return dt.datetime.combine(d, dt.time.min).replace(tzinfo=dt.timezone.utc)
-        parsed = dt.datetime.fromisoformat(end)
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt.timezone.utc)
-        return parsed
+        return parse_iso_utc(end)
     except Exception:
         return normalize_event_start(event)
 
 
-def format_local_datetime(value: object, all_day: bool = False) -> Optional[str]:
+def format_local_datetime(
+    value: object,
+    all_day: bool = False,
+    local_tz: Optional[dt.tzinfo] = None,
+) -> Optional[str]:
     if not isinstance(value, str):
         return None
+    if local_tz is None:
+        local_tz = LOCAL_TZ
+    return format_local_datetime_cached(value, all_day, local_tz)
+
 
+@lru_cache(maxsize=4096)
+def format_local_datetime_cached(value: str, all_day: bool, local_tz: Optional[dt.tzinfo]) -> str:
+    """Format an ISO string for display; many events share the same timestamps."""
     try:
-        local_tz = dt.datetime.now().astimezone().tzinfo
         if len(value) == 10:
             d = dt.date.fromisoformat(value)
             weekday = WEEKDAY_ABBR[d.weekday()]
@@ -287,7 +437,7 @@ def format_local_datetime(value: object, all_day: bool = False) -> Optional[str]
             local_dt = dt.datetime.combine(d, dt.time.min).replace(tzinfo=local_tz)
             weekday = WEEKDAY_ABBR[local_dt.weekday()]
             month = MONTH_ABBR[local_dt.month - 1]
-            return f"{weekday} {local_dt.day} {month} {local_dt.year} {local_dt:%H:%M}"
+            return f"{weekday} {local_dt.day} {month} {local_dt.year} {local_dt.hour:02d}:{local_dt.minute:02d}"
 
         parsed = dt.datetime.fromisoformat(value)
         if parsed.tzinfo is None:
@@ -295,30 +445,39 @@ def format_local_datetime(value: object, all_day: bool = False) -> Optional[str]
         local_dt = parsed.astimezone(local_tz)
         weekday = WEEKDAY_ABBR[local_dt.weekday()]
         month = MONTH_ABBR[local_dt.month - 1]
-        return f"{weekday} {local_dt.day} {month} {local_dt.year} {local_dt:%H:%M}"
+        return f"{weekday} {local_dt.day} {month} {local_dt.year} {local_dt.hour:02d}:{local_dt.minute:02d}"
     except Exception:
         return value
 
 
-def add_display_datetimes(events: List[Dict[str, object]]) -> List[Dict[str, object]]:
+def add_display_datetimes(
+    events: List[Event],
+    local_tz: Optional[dt.tzinfo] = None,
+) -> List[Event]:
+    if local_tz is None:
+        local_tz = LOCAL_TZ
     for event in events:
-        all_day = bool(event.get("all_day"))
-        event["start_local"] = format_local_datetime(event.get("start"), all_day)
-        event["end_local"] = format_local_datetime(event.get("end"), all_day)
+        event.start_local = format_local_datetime(event.start, event.all_day, local_tz)
+        event.end_local = format_local_datetime(event.end, event.all_day, local_tz)
     return events
 
 
 def filter_events(
-    events: List[Dict[str, object]],
+    events: Iterable[Event],
     after: Optional[dt.datetime],
     before: Optional[dt.datetime],
     limit: Optional[int],
-) -> List[Dict[str, object]]:
-    annotated: List[Tuple[dt.datetime, Dict[str, object]]] = []
+) -> List[Event]:
+    matched: List[Event] = []
     now = dt.datetime.now(dt.timezone.utc)
     for event in events:
-        start = normalize_event_start(event)
-        end = normalize_event_end(event)
+        # Reuse datetimes computed during parsing; re-parse only if absent.
+        start = event.sort_start
+        end = event.sort_end
+        if start is None:
+            start = event.sort_start = normalize_event_start(event)
+        if end is None:
+            end = event.sort_end = normalize_event_end(event)
         if start is None or end is None:
             continue
 
@@ -328,37 +487,49 @@ def filter_events(
         if before and start > before:
             continue
 
-        event["is_ongoing"] = start <= now <= end
-        annotated.append((start, event))
+        event.is_ongoing = start <= now <= end
+        matched.append(event)
 
-    annotated.sort(key=lambda pair: pair[0])
-    filtered = [event for _, event in annotated]
+    sort_key = attrgetter("sort_start")
+    if limit is not None and 0 <= limit < len(matched) // 2:
+        # Same result as sorted(...)[:limit], without sorting the whole list.
+        return heapq.nsmallest(limit, matched, key=sort_key)
+    matched.sort(key=sort_key)
     if limit is not None:
-        filtered = filtered[:limit]
-    return filtered
+        matched = matched[:limit]
+    return matched
 
 
-def render_text(events: List[Dict[str, object]]) -> str:
+def render_text(events: List[Event], local_tz: Optional[dt.tzinfo] = None) -> str:
     if not events:
         return "No matching events."
 
+    if local_tz is None:
+        local_tz = LOCAL_TZ
+
     lines: List[str] = []
     for idx, event in enumerate(events, start=1):
-        start_local = format_local_datetime(event.get("start"), bool(event.get("all_day")))
-        end_local = format_local_datetime(event.get("end"), bool(event.get("all_day")))
-        lines.append(f"{idx}. {event.get('summary') or '(no title)'}")
-        lines.append(f"   start: {start_local}")
-        lines.append(f"   end: {end_local}")
-        lines.append(f"   all_day: {event.get('all_day')}")
-        if event.get("location"):
-            lines.append(f"   location: {event.get('location')}")
-        if event.get("status"):
-            lines.append(f"   status: {event.get('status')}")
-        if event.get("organizer"):
-            lines.append(f"   organizer: {event.get('organizer')}")
-        attendees = event.get("attendees")
-        if isinstance(attendees, list) and attendees:
-            lines.append(f"   attendees: {', '.join(attendees)}")
+        # main() already stored these via add_display_datetimes.
+        start_local = event.start_local
+        if start_local is None:
+            start_local = format_local_datetime(event.start, event.all_day, local_tz)
+        end_local = event.end_local
+        if end_local is None:
+            end_local = format_local_datetime(event.end, event.all_day, local_tz)
+        lines.append(
+            f"{idx}. {event.summary or '(no title)'}\n"
+            f"   start: {start_local}\n"
+            f"   end: {end_local}\n"
+            f"   all_day: {event.all_day}"
+        )
+        if event.location:
+            lines.append(f"   location: {event.location}")
+        if event.status:
+            lines.append(f"   status: {event.status}")
+        if event.organizer:
+            lines.append(f"   organizer: {event.organizer}")
+        if event.attendees:
+            lines.append(f"   attendees: {', '.join(event.attendees)}")
     return "\n".join(lines)
 
 
@@ -396,20 +567,18 @@ def default_cache_dir() -> Path:
     return base / "stu-skills" / "ics-calendar-reader"
 
 
+@lru_cache(maxsize=128)
 def url_cache_key(url: str) -> str:
     return hashlib.sha256(url.encode("utf-8")).hexdigest()
 
 
-def parse_cached_timestamp(value: object) -> Optional[dt.datetime]:
-    if not isinstance(value, str):
-        return None
+def cached_fetch_time(meta_path: Path) -> Optional[dt.datetime]:
+    """Last fetch/revalidation time, recorded as the metadata file's mtime."""
     try:
-        parsed = dt.datetime.fromisoformat(value)
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt.timezone.utc)
-        return parsed
-    except Exception:
+        mtime = meta_path.stat().st_mtime
+    except OSError:
         return None
+    return dt.datetime.fromtimestamp(mtime, tz=dt.timezone.utc)
 
 
 def fetch_ics_url_content(url: str, cache_dir: Path, cache_ttl: int) -> str:
@@ -422,6 +591,13 @@ def fetch_ics_url_content(url: str, cache_dir: Path, cache_ttl: int) -> str:
     body_path = cache_dir / f"{key}.ics"
     meta_path = cache_dir / f"{key}.json"
 
+    now = dt.datetime.now(dt.timezone.utc)
+    fetched_at = cached_fetch_time(meta_path)
+    if body_path.exists() and fetched_at is not None:
+        age_seconds = (now - fetched_at).total_seconds()
+        if age_seconds <= cache_ttl:
+            return body_path.read_bytes().decode("utf-8", errors="replace")
+
     meta: Dict[str, object] = {}
     if meta_path.exists():
         try:
@@ -429,13 +605,6 @@ def fetch_ics_url_content(url: str, cache_dir: Path, cache_ttl: int) -> str:
         except Exception:
             meta = {}
 
-    now = dt.datetime.now(dt.timezone.utc)
-    fetched_at = parse_cached_timestamp(meta.get("fetched_at"))
-    if body_path.exists() and fetched_at is not None:
-        age_seconds = (now - fetched_at).total_seconds()
-        if age_seconds <= cache_ttl:
-            return body_path.read_text(encoding="utf-8", errors="replace")
-
     headers: Dict[str, str] = {}
     etag = meta.get("etag")
     last_modified = meta.get("last_modified")
@@ -447,22 +616,21 @@ def fetch_ics_url_content(url: str, cache_dir: Path, cache_ttl: int) -> str:
     request = urllib.request.Request(url, headers=headers)
     try:
         with urllib.request.urlopen(request) as response:
-            content = response.read().decode("utf-8", errors="replace")
-            body_path.write_text(content, encoding="utf-8")
+            raw = response.read()
+            body_path.write_bytes(raw)
+            content = raw.decode("utf-8", errors="replace")
             updated_meta = {
                 "url": url,
-                "fetched_at": now.isoformat(),
                 "etag": response.headers.get("ETag"),
                 "last_modified": response.headers.get("Last-Modified"),
             }
-            meta_path.write_text(json.dumps(updated_meta, indent=2), encoding="utf-8")
+            meta_path.write_text(dump_json(updated_meta), encoding="utf-8")
             return content
     except urllib.error.HTTPError as exc:
         if exc.code == 304 and body_path.exists():
-            meta["url"] = url
-            meta["fetched_at"] = now.isoformat()
-            meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
-            return body_path.read_text(encoding="utf-8", errors="replace")
+            # Validators are unchanged; only bump the mtime to restart the TTL.
+            meta_path.touch()
+            return body_path.read_bytes().decode("utf-8", errors="replace")
         raise
     except Exception:
         if body_path.exists():
@@ -470,10 +638,26 @@ def fetch_ics_url_content(url: str, cache_dir: Path, cache_ttl: int) -> str:
                 f"Warning: fetch failed for {url}; using stale cached calendar content.",
                 file=sys.stderr,
             )
-            return body_path.read_text(encoding="utf-8", errors="replace")
+            return body_path.read_bytes().decode("utf-8", errors="replace")
         raise
 
 
+def fetch_ics_urls(urls: List[str], cache_dir: Path, cache_ttl: int) -> Dict[str, str]:
+    """Fetch each distinct URL concurrently; returns content keyed by URL."""
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+
+    # Distinct URLs map to distinct cache files, so workers never share a path.
+    workers = min(MAX_FETCH_WORKERS, len(unique_urls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        contents = executor.map(
+            lambda url: fetch_ics_url_content(url, cache_dir=cache_dir, cache_ttl=cache_ttl),
+            unique_urls,
+        )
+        return dict(zip(unique_urls, contents))
+
+
 def get_default_cache_ttl() -> int:
     raw = os.environ.get("ICS_CACHE_TTL_SECONDS")
     if raw is None:
@@ -504,6 +688,7 @@ def main() -> int:
     parser.add_argument(
         "--cache-ttl",
         type=int,
+        # Read once per run, after load_env_defaults() so the .env value applies.
         default=get_default_cache_ttl(),
         help=(
             "Cache TTL in seconds for downloaded ICS URLs (default: 900). "
@@ -548,30 +733,29 @@ def main() -> int:
         )
         return 2
 
-    events: List[Dict[str, object]] = []
+    after = parse_filter_dt(args.after) if args.after else None
+    before = parse_filter_dt(args.before) if args.before else None
+
+    # Events are parsed lazily and filtered as they stream in, so events
+    # outside the window are never collected.
+    event_sources: List[Iterable[Event]] = []
     if args.ics_path:
-        content = Path(args.ics_path).read_text(encoding="utf-8", errors="replace")
-        events.extend(parse_ics_events(content))
+        event_sources.append(iter_ics_file_events(args.ics_path))
 
     cache_dir = Path(os.path.expanduser(args.cache_dir)) if args.cache_dir else default_cache_dir()
     cache_ttl = max(args.cache_ttl, 0)
 
-    for url in urls:
-        normalized_url = normalize_calendar_url(url)
-        content = fetch_ics_url_content(
-            normalized_url,
-            cache_dir=cache_dir,
-            cache_ttl=cache_ttl,
-        )
-        events.extend(parse_ics_events(content))
+    normalized_urls = [normalize_calendar_url(url) for url in urls]
+    contents = fetch_ics_urls(normalized_urls, cache_dir=cache_dir, cache_ttl=cache_ttl)
+    for url in normalized_urls:
+        event_sources.append(iter_ics_events(contents[url].splitlines()))
 
-    after = parse_filter_dt(args.after) if args.after else None
-    before = parse_filter_dt(args.before) if args.before else None
+    events = chain.from_iterable(event_sources)
     filtered = filter_events(events, after=after, before=before, limit=args.limit)
     filtered = add_display_datetimes(filtered)
 
     if args.format == "json":
-        print(json.dumps(filtered, indent=2, ensure_ascii=False))
+        print(dump_json([event.to_dict() for event in filtered]))
     else:
         print(render_text(filtered))
 